@@ -55,74 +55,43 @@ Find the top three Elves carrying the most Calories. How many Calories are those
 import fileinput
 import heapq
 import inspect
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
-class TopNHeap:
-    """Heap that only holds N values at most."""
-
-    def __init__(self, n: int) -> None:
-        self.data: list[int] = []
-        self._n = n
-
-    def push(self, val: int) -> None:
-        """
-        Push new value onto heap and ensure max number of values is not
-        passed.
-        """
-        if len(self.data) < self._n:
-            heapq.heappush(self.data, val)
+def iter_elf_calories(input_lines: Iterable[bytes]) -> Iterator[int]:
+    """Yield the total calories carried by each elf."""
+    current = 0
+    for line in input_lines:
+        if not line or line.isspace():  # Blank, with or without its newline
+            yield current
+            current = 0
         else:
-            heapq.heappushpop(self.data, val)
-
-    def sum(self) -> int:
-        """Get sum of all values."""
-        return sum(self.data)
+            current += int(line)
+    yield current  # Last chunk
 
 
-def find_most_calories(input_lines: Iterable[str]) -> int:
+def find_most_calories(input_lines: Iterable[bytes]) -> int:
     """
     Find the elf carrying the most calories and return the total calories
     they have.
     """
-    max_calories = -1
-    current = 0
-    for line in input_lines:
-        line = line.strip()
-        if line == '':
-            max_calories = max(max_calories, current)
-            current = 0
-        else:
-            current += int(line)
-    max_calories = max(max_calories, current)  # Last chunk
-    return max_calories
+    return max(iter_elf_calories(input_lines))
 
 
-def find_top_3_calories(input_lines: Iterable[str]) -> int:
+def find_top_3_calories(input_lines: Iterable[bytes]) -> int:
     """
     Find the top three elves carrying the most calories and return the total
     calories they have.
     """
     num_top_elves = 3
-    tops = TopNHeap(num_top_elves)
-
-    current = 0
-    for line in input_lines:
-        line = line.strip()
-        if line == '':
-            tops.push(current)
-            current = 0
-        else:
-            current += int(line)
-    tops.push(current)  # Last chunk
-
-    return tops.sum()
+    return sum(heapq.nlargest(num_top_elves, iter_elf_calories(input_lines)))
 
 
 def main() -> int:
-    calories = find_most_calories(fileinput.input(encoding='utf-8'))
+    input_lines = list(fileinput.input(mode='rb'))
+    calories = find_most_calories(input_lines)
     print(f'Part 1: {calories}')
-    top_3_calories = find_top_3_calories(fileinput.input(encoding='utf-8'))
+    top_3_calories = find_top_3_calories(input_lines)
     print(f'Part 2: {top_3_calories}')
     return 0
 
@@ -146,7 +115,7 @@ def example_part1() -> None:
 
         10000
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert find_most_calories(sample_input) == 24000
 
 
@@ -169,7 +138,7 @@ def example_part2() -> None:
 
         10000
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert find_top_3_calories(sample_input) == 45000
 
 
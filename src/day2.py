@@ -46,6 +46,7 @@ Following the Elf's instructions for the second column, what would your total sc
 """
 
 import fileinput
+from collections import Counter
 from enum import IntEnum
 from inspect import cleandoc
 from typing import Iterable
@@ -67,8 +68,6 @@ class Result(IntEnum):
     WIN = 6
 
 
-OPPONENT_MOVE_LABEL = {'A': Move.ROCK, 'B': Move.PAPER, 'C': Move.SCISSORS}
-SELF_MOVE_LABEL = {'X': Move.ROCK, 'Y': Move.PAPER, 'Z': Move.SCISSORS}
 RESULT_FROM_ROUND: dict[tuple[Move, Move], Result] = {
     (Move.ROCK, Move.ROCK): Result.DRAW,
     (Move.ROCK, Move.PAPER): Result.LOSS,
@@ -82,7 +81,6 @@ RESULT_FROM_ROUND: dict[tuple[Move, Move], Result] = {
 }
 """Maps (self_move, opponent_move) to result."""
 
-CORRECTED_RESULT_LABEL = {'X': Result.LOSS, 'Y': Result.DRAW, 'Z': Result.WIN}
 SELF_MOVE_FROM_DESIRED_RESULT: dict[tuple[Move, Result], Move] = {
     (opponent_move, result): self_move
     for (self_move, opponent_move), result in RESULT_FROM_ROUND.items()
@@ -95,40 +93,49 @@ def calculate_points(self_move: Move, opponent_move: Move) -> int:
     return self_move + RESULT_FROM_ROUND[(self_move, opponent_move)]
 
 
-def get_strategy_point_sum(strategy: Iterable[str]) -> int:
+STRATEGY_POINTS = tuple(
+    calculate_points(self_move, opponent_move)
+    for opponent_move in Move
+    for self_move in Move
+)
+"""Points for a round, indexed by 3 * opponent move index + self move index."""
+
+CORRECTED_STRATEGY_POINTS = tuple(
+    calculate_points(
+        SELF_MOVE_FROM_DESIRED_RESULT[(opponent_move, desired_result)], opponent_move
+    )
+    for opponent_move in Move
+    for desired_result in Result
+)
+"""Points for a round, indexed by 3 * opponent move index + result index."""
+
+
+def get_strategy_point_sum(strategy: Iterable[bytes]) -> int:
     """Get the number of points a strategy would result in."""
     points = 0
-    for line in strategy:
-        line.strip()
-        opponent_label, self_label = line.split()
-        opponent_move = OPPONENT_MOVE_LABEL[opponent_label]
-        self_move = SELF_MOVE_LABEL[self_label]
-        points += calculate_points(self_move, opponent_move)
+    for line, count in Counter(strategy).items():
+        round_idx = 3 * (line[0] - ord('A')) + line[2] - ord('X')
+        points += STRATEGY_POINTS[round_idx] * count
     return points
 
 
-def get_corrected_strategy_point_sum(strategy: Iterable[str]) -> int:
+def get_corrected_strategy_point_sum(strategy: Iterable[bytes]) -> int:
     """
     Get the number of points a strategy would result in, given corrected
     instructions.
     """
     points = 0
-    for line in strategy:
-        line.strip()
-        opponent_label, desired_result_label = line.split()
-        opponent_move = OPPONENT_MOVE_LABEL[opponent_label]
-        desired_result = CORRECTED_RESULT_LABEL[desired_result_label]
-        self_move = SELF_MOVE_FROM_DESIRED_RESULT[(opponent_move, desired_result)]
-        points += calculate_points(self_move, opponent_move)
+    for line, count in Counter(strategy).items():
+        round_idx = 3 * (line[0] - ord('A')) + line[2] - ord('X')
+        points += CORRECTED_STRATEGY_POINTS[round_idx] * count
     return points
 
 
 def main() -> int:
-    strategy_points = get_strategy_point_sum(fileinput.input(encoding='utf-8'))
+    strategy = list(fileinput.input(mode='rb'))
+    strategy_points = get_strategy_point_sum(strategy)
     print(f'Part 1: {strategy_points}')
-    corrected_strategy_points = get_corrected_strategy_point_sum(
-        fileinput.input(encoding='utf-8')
-    )
+    corrected_strategy_points = get_corrected_strategy_point_sum(strategy)
     print(f'Part 2: {corrected_strategy_points}')
     return 0
 
@@ -141,7 +148,7 @@ def example_part1() -> None:
         B X
         C Z
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert get_strategy_point_sum(sample_input) == 15
 
 
@@ -153,7 +160,7 @@ def example_part2() -> None:
         B X
         C Z
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert get_corrected_strategy_point_sum(sample_input) == 12
 
 
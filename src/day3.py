@@ -75,71 +75,56 @@ def letter_range(start: str, end: str) -> Iterator[str]:
     return (chr(val) for val in range(ord(start), ord(end) + 1))
 
 
-ITEM_PRIORITIES = {
-    letter: priority
-    for letter, priority in zip(
-        itertools.chain(letter_range('a', 'z'), letter_range('A', 'Z')),
-        range(1, 53),
-    )
-}
+def build_priority_table() -> bytes:
+    """Build a table mapping an item's ASCII code to its priority."""
+    table = bytearray(128)
+    letters = itertools.chain(letter_range('a', 'z'), letter_range('A', 'Z'))
+    for priority, letter in enumerate(letters, start=1):
+        table[ord(letter)] = priority
+    return bytes(table)
 
 
-def find_item_in_both_compartments(rucksack_string: str) -> str:
-    """Find the item letter that appears in both compartments of a rucksack."""
-    left, right = (
-        rucksack_string[: len(rucksack_string) // 2],
-        rucksack_string[len(rucksack_string) // 2 :],
-    )
-    left_letters = set(left)
-    right_letters = set(right)
-    return left_letters.intersection(right_letters).pop()
+ITEM_PRIORITIES = build_priority_table()
+"""Maps an item's ASCII code to its priority, or 0 for non-item characters."""
+
+
+def find_priority_in_both_compartments(rucksack: bytes) -> int:
+    """
+    Find the priority of the item that appears in both compartments of a
+    rucksack.
+    """
+    half = len(rucksack) // 2  # A trailing newline falls in the second half
+    common_items = set(rucksack[:half]).intersection(rucksack[half:])
+    return ITEM_PRIORITIES[common_items.pop()]
 
 
-def find_priority_sums(rucksacks: Iterable[str]) -> int:
+def find_priority_sums(rucksacks: Iterable[bytes]) -> int:
     """
     Find sum of priorities for common values in both compartments per
     rucksack.
     """
     priority_sum = 0
     for line in rucksacks:
-        line.strip()
-        priority_sum += ITEM_PRIORITIES[find_item_in_both_compartments(line)]
+        priority_sum += find_priority_in_both_compartments(line)
     return priority_sum
 
 
-def find_common_group_item(group_rucksacks: Iterable[str]) -> str:
-    """Find the item letter that appears in all rucksacks in the group."""
-    group_sets = [set(rucksack.strip()) for rucksack in group_rucksacks]
-    return group_sets[0].intersection(*group_sets[1:]).pop()
-
-
-def grouper(iterable, n, *, incomplete='fill', fillvalue=None):
-    "Collect data into non-overlapping fixed-length chunks or blocks"
-    # grouper('ABCDEFG', 3, fillvalue='x') --> ABC DEF Gxx
-    # grouper('ABCDEFG', 3, incomplete='strict') --> ABC DEF ValueError
-    # grouper('ABCDEFG', 3, incomplete='ignore') --> ABC DEF
-    args = [iter(iterable)] * n
-    if incomplete == 'fill':
-        return itertools.zip_longest(*args, fillvalue=fillvalue)
-    if incomplete == 'strict':
-        return zip(*args, strict=True)
-    if incomplete == 'ignore':
-        return zip(*args)
-    else:
-        raise ValueError('Expected fill, strict, or ignore')
-
-
-def find_group_badge_priority_sum(rucksacks: Iterable[str]) -> int:
+def find_group_badge_priority_sum(rucksacks: Iterable[bytes]) -> int:
     """Find sum of item priorities for each group's badge item."""
-    groups = grouper(rucksacks, 3)
-    common_items = (find_common_group_item(group) for group in groups)
-    return sum(ITEM_PRIORITIES[item] for item in common_items)
+    rucksacks = list(rucksacks)
+    groups = zip(rucksacks[0::3], rucksacks[1::3], rucksacks[2::3], strict=True)
+    # Stripping one rucksack keeps the shared newline out of the intersection
+    return sum(
+        ITEM_PRIORITIES[set(first.rstrip()).intersection(second, third).pop()]
+        for first, second, third in groups
+    )
 
 
 def main() -> int:
-    priority_sum = find_priority_sums(fileinput.input(encoding='utf-8'))
+    rucksacks = list(fileinput.input(mode='rb'))
+    priority_sum = find_priority_sums(rucksacks)
     print(f'Part 1: {priority_sum}')
-    common_item_sum = find_group_badge_priority_sum(fileinput.input(encoding='utf-8'))
+    common_item_sum = find_group_badge_priority_sum(rucksacks)
     print(f'Part 2: {common_item_sum}')
     return 0
 
@@ -155,7 +140,7 @@ def example_part1() -> None:
         ttgJtRGJQctTZtZT
         CrZsJsPPZsGzwwsLwLmpwMDw
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert find_priority_sums(sample_input) == 157
 
 
@@ -170,7 +155,7 @@ def example_part2() -> None:
         ttgJtRGJQctTZtZT
         CrZsJsPPZsGzwwsLwLmpwMDw
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert find_group_badge_priority_sum(sample_input) == 70
 
 
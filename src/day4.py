@@ -61,82 +61,54 @@ In how many assignment pairs do the ranges overlap?
 """
 
 import fileinput
-import re
 from inspect import cleandoc
-from typing import Iterable, NamedTuple
+from typing import Iterable, Iterator, TypeAlias
 
-_LINE_PATTERN = re.compile(r'(\d+)-(\d+),(\d+)-(\d+)')
+_SEPARATORS = bytes.maketrans(b',-', b'  ')
 
+SectionBounds: TypeAlias = tuple[int, int, int, int]
+"""First start, first end, second start, second end."""
 
-class SectionAssignment(NamedTuple):
-    """Section assignment for a given elf."""
 
-    start: int
-    end: int
+def parse_section_bounds(data_lines: Iterable[bytes]) -> Iterator[SectionBounds]:
+    """Parse all data lines at once into section bounds for each pair."""
+    # Separate lines explicitly, as the last one might not end in a newline
+    fields = b' '.join(data_lines).translate(_SEPARATORS).split()
+    if len(fields) % 4:
+        raise ValueError('Input not in correct format.')
+    try:
+        numbers = iter([int(field) for field in fields])
+    except ValueError as exc:
+        raise ValueError('Input not in correct format.') from exc
+    return zip(numbers, numbers, numbers, numbers)
 
 
-class ElfPair(NamedTuple):
-    """Pair of two elf section assignments."""
+def count_redundant_assignments(bounds: Iterable[SectionBounds]) -> int:
+    """Count the pairs where one assignment fully contains the other."""
+    return sum(1 for a, b, c, d in bounds if (a >= c and b <= d) or (c >= a and d <= b))
 
-    first: SectionAssignment
-    second: SectionAssignment
 
+def count_overlapping_assignments(bounds: Iterable[SectionBounds]) -> int:
+    """Count the pairs where the assignments overlap at all."""
+    return sum(1 for a, b, c, d in bounds if a <= d and c <= b)
 
-def parse_pair_line(line: str) -> ElfPair:
-    """Parse a data line into a pair of elf section assignments."""
-    line.strip()
-    matches = _LINE_PATTERN.match(line)
-    if matches is None:
-        raise ValueError(f'Input not in correct format: {line}')
-    first_start = int(matches.group(1))
-    first_end = int(matches.group(2))
-    second_start = int(matches.group(3))
-    second_end = int(matches.group(4))
-    pair = ElfPair(
-        SectionAssignment(first_start, first_end),
-        SectionAssignment(second_start, second_end),
-    )
-    return pair
 
-
-def determine_if_redundant_assignment(pair: ElfPair) -> bool:
-    """Determine if a pair of elves has a redundant assignment."""
-    first, second = pair
-    return (first.start >= second.start and first.end <= second.end) or (
-        second.start >= first.start and second.end <= first.end
-    )
-
-
-def determine_if_overlapping_assignment(pair: ElfPair) -> bool:
-    """Determine if a pair of elves has any overlap in their assignment."""
-    first, second = pair
-    return (first.start >= second.start and first.start <= second.end) or (
-        second.start >= first.start and second.start <= first.end
-    )
-
-
-def find_number_of_redundant_assignments(data_lines: Iterable[str]) -> int:
+def find_number_of_redundant_assignments(data_lines: Iterable[bytes]) -> int:
     """Find number of redundant assignments for each pair of elves."""
-    return [
-        determine_if_redundant_assignment(parse_pair_line(line)) for line in data_lines
-    ].count(True)
+    return count_redundant_assignments(parse_section_bounds(data_lines))
 
 
-def find_number_of_overlapping_assignments(data_lines: Iterable[str]) -> int:
+def find_number_of_overlapping_assignments(data_lines: Iterable[bytes]) -> int:
     """Find number of overlapping assignments for each pair of elves."""
-    return [
-        determine_if_overlapping_assignment(parse_pair_line(line))
-        for line in data_lines
-    ].count(True)
+    return count_overlapping_assignments(parse_section_bounds(data_lines))
 
 
 def main() -> int:
     """Main entry point."""
-    redundancies = find_number_of_redundant_assignments(
-        fileinput.input(encoding='utf-8')
-    )
+    bounds = list(parse_section_bounds(fileinput.input(mode='rb')))
+    redundancies = count_redundant_assignments(bounds)
     print(f'Part 1: {redundancies}')
-    overlaps = find_number_of_overlapping_assignments(fileinput.input(encoding='utf-8'))
+    overlaps = count_overlapping_assignments(bounds)
     print(f'Part 2: {overlaps}')
     return 0
 
@@ -152,7 +124,7 @@ def examples() -> None:
         6-6,4-6
         2-6,4-8
         """
-    ).splitlines(keepends=True)
+    ).encode().splitlines(keepends=True)
     assert find_number_of_redundant_assignments(sample_input) == 2
     assert find_number_of_overlapping_assignments(sample_input) == 4
 
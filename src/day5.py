@@ -109,12 +109,9 @@ Before the rearrangement process finishes, update your simulation so that the El
 """
 
 import fileinput
-import re
 from inspect import cleandoc
 from typing import Iterable, NamedTuple
 
-INSTRUCTION_PATTERN = re.compile(r'move (\d+) from (\d+) to (\d+)')
-
 
 class Instruction(NamedTuple):
     """Instruction data container."""
@@ -127,7 +124,7 @@ class Instruction(NamedTuple):
 class Scenario(NamedTuple):
     """Container for all scenario data."""
 
-    stacks: list[list[str]]
+    stacks: list[bytearray]
     instructions: list[Instruction]
 
 
@@ -141,60 +138,72 @@ def parse_input(lines: Iterable) -> Scenario:
     )
 
 
-def parse_stacks(lines: list[str]) -> list[list[str]]:
-    """Parse stack text description into actual stacks of labels."""
+def parse_stacks(lines: list[str]) -> list[bytearray]:
+    """
+    Parse stack text description into actual stacks of labels, one byte per
+    crate.
+    """
     stack_labels = lines.pop().rstrip()
     num_stacks = int(stack_labels[-1])
-    stacks: list[list[str]] = [[] for _ in range(num_stacks)]
-
-    for line in lines[::-1]:
-        for idx, label in enumerate(line[1::4]):
-            if not label.isspace():
-                stacks[idx].append(label)
+    row_width = 4 * num_stacks
 
-    return stacks
+    # Labels sit in every fourth column, so transposing the padded rows from
+    # the bottom up gives each stack with blanks only above its top crate
+    rows = (line.ljust(row_width)[1::4] for line in reversed(lines))
+    return [
+        bytearray(''.join(column).rstrip().encode('ascii')) for column in zip(*rows)
+    ]
 
 
 def parse_instructions(lines: list[str]) -> list[Instruction]:
     """Parse instruction lines into data structure."""
     instructions: list[Instruction] = []
     for line in lines:
-        matches = re.match(INSTRUCTION_PATTERN, line)
-        if matches is None:
-            raise ValueError('Instructions in wrong format.')
-        instruction = Instruction(
-            int(matches.group(1)), int(matches.group(2)) - 1, int(matches.group(3)) - 1
-        )
+        try:
+            _, quantity, _, from_stack, _, to_stack = line.split()
+            instruction = Instruction(
+                int(quantity), int(from_stack) - 1, int(to_stack) - 1
+            )
+        except ValueError as exc:
+            raise ValueError('Instructions in wrong format.') from exc
         instructions.append(instruction)
     return instructions
 
 
 def run_instructions_9000(
-    stacks: list[list[str]], instructions: list[Instruction]
+    stacks: list[bytearray], instructions: list[Instruction]
 ) -> str:
     """
     Run the given instructions to move crates around stacks. Return labels of
     the top crates as a single string.
     """
-    for instruction in instructions:
-        for _ in range(instruction.quantity):
-            stacks[instruction.to_stack].append(stacks[instruction.from_stack].pop())
-    return ''.join([stack[-1] for stack in stacks])
+    for quantity, from_idx, to_idx in instructions:
+        from_stack = stacks[from_idx]
+        split = len(from_stack) - quantity
+        if split < 0:
+            raise ValueError('Instructions in wrong format.')
+        moved = from_stack[split:]
+        moved.reverse()  # One crate at a time, so they end up in reverse order
+        stacks[to_idx] += moved
+        del from_stack[split:]
+    return bytes(stack[-1] for stack in stacks).decode('ascii')
 
 
 def run_instructions_9001(
-    stacks: list[list[str]], instructions: list[Instruction]
+    stacks: list[bytearray], instructions: list[Instruction]
 ) -> str:
     """
     Run the given instructions using the CrateMover 9001, which moves
     multiple crates at the same time.
     """
-    for instruction in instructions:
-        from_front = stacks[instruction.from_stack][: -instruction.quantity]
-        from_back = stacks[instruction.from_stack][-instruction.quantity :]
-        stacks[instruction.to_stack] += from_back
-        stacks[instruction.from_stack] = from_front
-    return ''.join([stack[-1] for stack in stacks])
+    for quantity, from_idx, to_idx in instructions:
+        from_stack = stacks[from_idx]
+        split = len(from_stack) - quantity
+        if split < 0:
+            raise ValueError('Instructions in wrong format.')
+        stacks[to_idx] += from_stack[split:]
+        del from_stack[split:]
+    return bytes(stack[-1] for stack in stacks).decode('ascii')
 
 
 def solve_part1(lines: Iterable[str]) -> str:
@@ -211,9 +220,11 @@ def solve_part2(lines: Iterable[str]) -> str:
 
 def main() -> int:
     """Main entry point."""
-    final_state_9000 = solve_part1(fileinput.input(encoding='utf-8'))
+    scenario = parse_input(fileinput.input(encoding='utf-8'))
+    stacks_9000 = [stack.copy() for stack in scenario.stacks]  # Moves mutate
+    final_state_9000 = run_instructions_9000(stacks_9000, scenario.instructions)
     print(f'Part 1: {final_state_9000}')
-    final_state_9001 = solve_part2(fileinput.input(encoding='utf-8'))
+    final_state_9001 = run_instructions_9001(scenario.stacks, scenario.instructions)
     print(f'Part 2: {final_state_9001}')
     return 0
 
@@ -50,30 +50,22 @@ Here are the first positions of start-of-message markers for all of the above ex
 How many characters need to be processed before the first start-of-message marker is detected?
 """
 
-import collections
 import fileinput
-import itertools
-from typing import Iterator
-
-
-def sliding_window(iterable, n) -> Iterator:
-    """From itertools recipes."""
-    # sliding_window('ABCDEFG', 4) --> ABCD BCDE CDEF DEFG
-    it = iter(iterable)
-    window = collections.deque(itertools.islice(it, n), maxlen=n)
-    if len(window) == n:
-        yield tuple(window)
-    for x in it:
-        window.append(x)
-        yield tuple(window)
 
 
 def find_non_repeating_letter_marker(buffer: str, window_size: int) -> int:
     """Find the index of the first set of non-repeated letters in a given sized window."""
-    for window_idx, window in enumerate(sliding_window(buffer, window_size)):
-        letter_set = set(window)
-        if len(letter_set) == window_size:
-            return window_idx + window_size
+    letters = buffer.encode('ascii')
+    # Start of the longest run of distinct letters ending at the current one;
+    # a repeat moves it just past the earlier copy of that letter
+    start = 0
+    last_seen = [-1] * 256
+    for pos, letter in enumerate(letters):
+        if last_seen[letter] >= start:
+            start = last_seen[letter] + 1
+        last_seen[letter] = pos
+        if pos - start + 1 == window_size:
+            return pos + 1
     raise ValueError('No start-of-packet marker.')
 
 
@@ -101,112 +101,76 @@ Directories e and a are both too small; deleting them would not free up enough s
 Find the smallest directory that, if deleted, would free up enough space on the filesystem to run the update. What is the total size of that directory?
 """
 
-from __future__ import annotations
-
 import fileinput
-from dataclasses import dataclass
 from inspect import cleandoc
-from typing import Iterable, Protocol
-
-
-class Inode(Protocol):
-    """General Inode representation."""
-
-    name: str
-
-    @property
-    def size(self) -> int:
-        ...
-
-
-@dataclass
-class File:
-    """Individual file representation."""
-
-    name: str
-    size: int
-    parent: Directory
+from typing import Iterable
 
 
-@dataclass
-class Directory:
-    """Directory representation."""
-
-    name: str
-    parent: Directory | None
-    children: list[Inode]
+def close_directories(
+    open_path: list[str],
+    open_sizes: list[int],
+    dir_sizes: dict[tuple[str, ...], int],
+    depth: int,
+) -> None:
+    """
+    Close open directories until only `depth` remain open, adding the size
+    seen during this visit to the directory's total and to its parent.
+    """
+    while len(open_sizes) > depth:
+        size = open_sizes.pop()
+        path = tuple(open_path)
+        open_path.pop()
+        dir_sizes[path] = dir_sizes.get(path, 0) + size
+        if open_sizes:
+            open_sizes[-1] += size
 
-    @property
-    def size(self) -> int:
-        return sum(child.size for child in self.children)
 
+def parse_dir_sizes(input_lines: Iterable[str]) -> list[int]:
+    """
+    Parse the input log straight into the sizes of all visited directories.
+    """
+    # Path and running size of each directory from root down to the cwd
+    open_path = ['/']
+    open_sizes = [0]
+    dir_sizes: dict[tuple[str, ...], int] = {}
+    for line in input_lines:
+        first_char = line[0]
+        if first_char == '$':
+            if line[2] == 'c':  # cd; ls needs nothing
+                dest_name = line[5:].strip()
+                if dest_name == '..':
+                    depth = len(open_sizes) - 1
+                    close_directories(open_path, open_sizes, dir_sizes, depth)
+                elif dest_name == '/':
+                    close_directories(open_path, open_sizes, dir_sizes, 1)
+                else:
+                    open_path.append(dest_name)
+                    open_sizes.append(0)
+        elif first_char != 'd':  # dir entries only matter once visited
+            open_sizes[-1] += int(line[: line.find(' ')])
+    close_directories(open_path, open_sizes, dir_sizes, 0)
+    return list(dir_sizes.values())
+
+
+def calculate_sum_of_small_dirs(dir_sizes: list[int]) -> int:
+    """Calculate sum of directory sizes that are at most 100,000."""
+    return sum(size for size in dir_sizes if size <= 100_000)
+
+
+def calculate_smallest_deletable_size(dir_sizes: list[int]) -> int:
+    """
+    Calculate the size of the smallest directory that frees up enough space
+    when deleted.
+    """
+    total_disk_space = 70_000_000
+    total_needed_space = 30_000_000
 
-def parse_input(input_lines: Iterable[str]) -> Directory:
-    """Parse the input log and return the filesystem tree structure."""
-    root = Directory('/', None, [])
+    root_size = max(dir_sizes)  # Root contains every other directory
+    current_free_space = total_disk_space - root_size
+    needed_space = total_needed_space - current_free_space
 
-    cwd = root
-    cwd_subdirs: dict[str, Directory] = {}
-    for line in input_lines:
-        line = line.strip()
-
-        if line[:4] == '$ cd':
-            dest_name = line[5:]
-            if dest_name == '..':
-                assert cwd.parent is not None
-                cwd = cwd.parent
-                cwd_subdirs = {
-                    child.name: child
-                    for child in cwd.children
-                    if isinstance(child, Directory)
-                }
-            elif dest_name == '/':
-                cwd = root
-                cwd_subdirs = {
-                    child.name: child
-                    for child in cwd.children
-                    if isinstance(child, Directory)
-                }
-            else:
-                cwd = cwd_subdirs[dest_name]
-                cwd_subdirs = {}
-
-        elif line[:4] == '$ ls':
-            pass  # Don't have to do anything, just read next output
-
-        else:  # Must be output giving us new inodes
-            tokens = line.split()
-            if tokens[0] == 'dir':
-                new_dir = Directory(tokens[1], cwd, [])
-                cwd.children.append(new_dir)
-                cwd_subdirs[tokens[1]] = new_dir
-            else:
-                new_file = File(tokens[1], int(tokens[0]), cwd)
-                cwd.children.append(new_file)
-
-    return root
-
-
-def print_filesystem(inode: Inode, indent_level: int) -> None:
-    """Print the filesystem tree for debugging."""
-    indent = '  ' * indent_level
-    inode_type = 'dir' if isinstance(inode, Directory) else 'file'
-    type_label = f'({inode_type}, size={inode.size})'
-
-    print(f'{indent}- {inode.name} {type_label}')
-
-    if isinstance(inode, Directory):
-        for child in inode.children:
-            print_filesystem(child, indent_level + 1)
-
-
-def calculate_sum_of_small_dirs(directory: Directory) -> int:
-    """Calculate sum of directories if size <= 100,000 recursively."""
-    size_if_small = directory.size if directory.size <= 100_000 else 0
-    for child in directory.children:
-        if isinstance(child, Directory):
-            size_if_small += calculate_sum_of_small_dirs(child)
-    return size_if_small
+    big_enough_dirs = filter(lambda size: size >= needed_space, dir_sizes)
+    return min(big_enough_dirs)
 
 
 def find_sum_of_small_dirs(input_lines: Iterable[str]) -> int:
@@ -214,20 +178,7 @@ def find_sum_of_small_dirs(input_lines: Iterable[str]) -> int:
     Find all directories with a total size of at most 100,000 and return
     their sum.
     """
-    root = parse_input(input_lines)
-    return calculate_sum_of_small_dirs(root)
-
-
-def get_dirs_sizes(directory: Directory) -> list[int]:
-    """Get sizes of all directories recursively."""
-    return [directory.size] + sum(
-        [
-            get_dirs_sizes(child)
-            for child in directory.children
-            if isinstance(child, Directory)
-        ],
-        [],
-    )
+    return calculate_sum_of_small_dirs(parse_dir_sizes(input_lines))
 
 
 def find_smallest_deletable_directory(input_lines: Iterable[str]) -> int:
@@ -235,27 +186,17 @@ def find_smallest_deletable_directory(input_lines: Iterable[str]) -> int:
     Find the smallest directory to delete that gives us enough free space.
     Return the size of that directory.
     """
-    total_disk_space = 70_000_000
-    total_needed_space = 30_000_000
-
-    root = parse_input(input_lines)
-    current_free_space = total_disk_space - root.size
-    needed_space = total_needed_space - current_free_space
-
-    dir_sizes = get_dirs_sizes(root)
-    big_enough_dirs = filter(lambda size: size >= needed_space, dir_sizes)
-    return min(big_enough_dirs)
+    return calculate_smallest_deletable_size(parse_dir_sizes(input_lines))
 
 
 def main() -> int:
     """Main entry point."""
     examples()
 
-    sum_of_small_dirs = find_sum_of_small_dirs(fileinput.input(encoding='utf-8'))
+    dir_sizes = parse_dir_sizes(fileinput.input(encoding='utf-8'))
+    sum_of_small_dirs = calculate_sum_of_small_dirs(dir_sizes)
     print(f'Part 1: {sum_of_small_dirs}')
-    smallest_deletable_dir_size = find_smallest_deletable_directory(
-        fileinput.input(encoding='utf-8')
-    )
+    smallest_deletable_dir_size = calculate_smallest_deletable_size(dir_sizes)
     print(f'Part 2: {smallest_deletable_dir_size}')
 
     return 0
@@ -73,108 +73,113 @@ Consider each tree on your map. What is the highest scenic score possible for an
 """
 
 import fileinput
-import math
 from inspect import cleandoc
-from typing import Iterable, TypeAlias
+from typing import Iterable, Sequence, TypeAlias
 
-Grid: TypeAlias = list[list[int]]
-Point: TypeAlias = tuple[int, int]
+Grid: TypeAlias = list[bytes]
 
+_HEIGHTS = bytes.maketrans(b'0123456789', bytes(range(10)))
 
-def parse_grid(lines: Iterable[str]) -> Grid:
-    """Parse grid into 2D array."""
-    return [[int(char) for char in line.strip()] for line in lines]
 
+def parse_grid(lines: Iterable[bytes]) -> Grid:
+    """Parse grid into rows of tree heights."""
+    return [line.strip().translate(_HEIGHTS) for line in lines]
 
-def determine_visible_in_ray(grid: Grid, ray: list[Point]) -> list[Point]:
+
+def determine_visible_in_line(line: bytes) -> list[int]:
+    """
+    Determine which trees in a line are visible from either end of it. Return
+    their indices, possibly with repeats.
+    """
+    # A tree is visible from the start iff it is the first one at least as
+    # tall as itself, so searching each height from the tallest down finds
+    # every visible tree without walking the line
+    visible: list[int] = []
+    first_taller = len(line)
+    last_taller = -1
+    for height in range(9, -1, -1):
+        first = line.find(height)
+        if first != -1 and first < first_taller:
+            visible.append(first)
+            first_taller = first
+        last = line.rfind(height)
+        if last > last_taller:
+            visible.append(last)
+            last_taller = last
+    return visible
+
+
+def find_viewing_distances(line: Sequence[int]) -> tuple[list[int], list[int]]:
     """
-    Determine which points in the ray are visible when checking both directions
-    (front and back along the same ray). Return the points which are visible.
+    Find how many trees each tree in a line can see when looking towards the
+    start and towards the end of the line.
     """
-    # Forward pass
-    max_height = -1
-    visible: set[Point] = set()
-    for point in ray:
-        if grid[point[0]][point[1]] > max_height:
-            visible.add(point)
-            max_height = grid[point[0]][point[1]]
-
-    # Backward pass
-    max_height = -1
-    for point in ray[::-1]:
-        if grid[point[0]][point[1]] > max_height:
-            visible.add(point)
-            max_height = grid[point[0]][point[1]]
-
-    return list(visible)
-
-
-def determine_visible_from_treehouse(
-    grid: Grid, ray: list[Point], blocking_height: int
-) -> int:
-    """Determine which points are visible from the treehouse."""
-    for i, point in enumerate(ray):
-        px, py = point
-        if grid[px][py] >= blocking_height:
-            return i + 1
-    return len(ray)
-
-
-def calculate_visible_trees(lines: Iterable[str]) -> int:
+    to_start = list(range(len(line)))  # Unless blocked, to the edge
+    to_end = list(range(len(line) - 1, -1, -1))
+    # Trees whose view towards the end isn't blocked yet; heights never
+    # increase towards the top
+    unblocked: list[int] = []
+    for idx, height in enumerate(line):
+        while unblocked and line[unblocked[-1]] < height:
+            blocked_idx = unblocked.pop()
+            to_end[blocked_idx] = idx - blocked_idx
+        if unblocked:
+            # Nearest tree at least as tall blocks the view towards the start
+            to_start[idx] = idx - unblocked[-1]
+            if line[unblocked[-1]] == height:
+                blocked_idx = unblocked.pop()
+                to_end[blocked_idx] = idx - blocked_idx
+        unblocked.append(idx)
+    return to_start, to_end
+
+
+def calculate_visible_trees(grid: Grid) -> int:
     """Calculate how many trees are visible in the grid."""
-    grid = parse_grid(lines)
-    grid_size = len(grid)
-    visible_grid = [[False for _ in row] for row in grid]
-    left_right_rays = [
-        [(row_idx, col_idx) for col_idx in range(grid_size)]
-        for row_idx in range(grid_size)
-    ]
-    up_down_rays = [
-        [(row_idx, col_idx) for row_idx in range(grid_size)]
-        for col_idx in range(grid_size)
-    ]
-
-    for ray in left_right_rays + up_down_rays:
-        visible = determine_visible_in_ray(grid, ray)
-        for point in visible:
-            visible_grid[point[0]][point[1]] = True
-
-    flat_grid: list[bool] = sum(visible_grid, [])
-    return flat_grid.count(True)
-
-
-def get_scenic_score(grid: Grid, point: Point) -> int:
-    """Get the scenic score of a given tree."""
-    grid_size = len(grid)
-    px, py = point
-    height = grid[px][py]
-    rays = [
-        [(px, col) for col in range(py + 1, grid_size)],  # Going right
-        [(px, col) for col in range(py - 1, -1, -1)],  # Going left
-        [(row, py) for row in range(px - 1, -1, -1)],  # Going up
-        [(row, py) for row in range(px + 1, grid_size)],  # Going down
-    ]
-    return math.prod(
-        [determine_visible_from_treehouse(grid, ray, height) for ray in rays]
-    )
-
-
-def find_highest_scenic_score(lines: Iterable[str]) -> int:
+    cols = [bytes(col) for col in zip(*grid)]
+    visible_grid = [bytearray(len(row)) for row in grid]
+    for row_idx, row in enumerate(grid):
+        visible_row = visible_grid[row_idx]
+        for col_idx in determine_visible_in_line(row):
+            visible_row[col_idx] = 1
+    for col_idx, col in enumerate(cols):
+        for row_idx in determine_visible_in_line(col):
+            visible_grid[row_idx][col_idx] = 1
+    return sum(visible_row.count(1) for visible_row in visible_grid)
+
+
+def find_highest_scenic_score(grid: Grid) -> int:
     """Find the highest scenic score."""
-    grid = parse_grid(lines)
-    grid_size = len(grid)
-    all_points = [(x, y) for x in range(grid_size) for y in range(grid_size)]
-    scenic_scores = [get_scenic_score(grid, point) for point in all_points]
-    return max(scenic_scores)
+    # Trees on the edge can't see past it, so they always score 0. Only the
+    # interior rows and columns need sweeping; the edges still block views.
+    if len(grid) < 3 or len(grid[0]) < 3:
+        return 0
+    interior = slice(1, -1)
+    left_by_row, right_by_row = zip(
+        *(find_viewing_distances(row) for row in grid[interior])
+    )
+    up_by_col, down_by_col = zip(
+        *(find_viewing_distances(col) for col in list(zip(*grid))[interior])
+    )
+    # Trim and transpose so each is indexed [row - 1][col - 1]
+    lefts = [distances[interior] for distances in left_by_row]
+    rights = [distances[interior] for distances in right_by_row]
+    ups = list(zip(*up_by_col))[interior]
+    downs = list(zip(*down_by_col))[interior]
+    return max(
+        right * left * down * up
+        for right_row, left_row, down_row, up_row in zip(rights, lefts, downs, ups)
+        for right, left, down, up in zip(right_row, left_row, down_row, up_row)
+    )
 
 
 def main() -> int:
     """Main entry point."""
     examples()
 
-    visible_trees = calculate_visible_trees(fileinput.input(encoding='utf-8'))
+    grid = parse_grid(fileinput.input(mode='rb'))
+    visible_trees = calculate_visible_trees(grid)
     print(f'Part 1: {visible_trees}')
-    scenic_score = find_highest_scenic_score(fileinput.input(encoding='utf-8'))
+    scenic_score = find_highest_scenic_score(grid)
     print(f'Part 2: {scenic_score}')
 
     return 0
@@ -182,17 +187,21 @@ def main() -> int:
 
 def examples() -> None:
     """Given example cases."""
-    sample_input = cleandoc(
-        """
-        30373
-        25512
-        65332
-        33549
-        35390
-        """
-    ).splitlines(keepends=True)
-    assert calculate_visible_trees(sample_input) == 21
-    assert find_highest_scenic_score(sample_input) == 8
+    sample_grid = parse_grid(
+        cleandoc(
+            """
+            30373
+            25512
+            65332
+            33549
+            35390
+            """
+        )
+        .encode()
+        .splitlines(keepends=True)
+    )
+    assert calculate_visible_trees(sample_grid) == 21
+    assert find_highest_scenic_score(sample_grid) == 8
 
 
 if __name__ == '__main__':